@@ -5,16 +5,23 @@ import sys
 import time
 import re
 import platform
+import functools
+import itertools
+import queue
+import threading
+import csv
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from tkinter import font as tkfont
 import barcode
-from barcode.writer import ImageWriter
-from PIL import Image, ImageTk
-import io
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+IS_WINDOWS = platform.system() == 'Windows'
 
 # Printer configuration - platform-specific defaults
-if platform.system() == 'Windows':
+if IS_WINDOWS:
     # Windows: Use printer name or COM port
     # Examples: "Thermal Printer", "COM3", "LPT1"
     PRINTER = "Thermal Printer"  # Change to your printer name or COM port
@@ -24,46 +31,81 @@ else:
 
 DOTS_MM = 8  # printer dots per mm, 8 == 203 dpi
 
+_STATUS_RE = re.compile(r'[@BCFPW]@@@')  # printer status meaning "ready"
+_COM_RE = re.compile(r'COM\d+', re.IGNORECASE)  # Windows serial port name
+_BAR_PIXELS = bytes.maketrans(b'01', b'\xff\x00')  # barcode module -> 'L' pixel
+
+
+@functools.lru_cache(maxsize=1)
+def _win32print():
+    """Import pywin32's win32print on first use (Windows only)"""
+    import win32print
+    return win32print
+
+
+@functools.lru_cache(maxsize=16)
+def _load_font(path, size):
+    """Load a TrueType font once per (path, size), None if unavailable"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_font():
+    """PIL's built-in bitmap font"""
+    return ImageFont.load_default()
 
+
+@dataclasses.dataclass(slots=True)
 class BarcodeConfig:
     """Configuration for barcode and label settings"""
-    def __init__(self):
-        # Label dimensions
-        self.width_mm = 100
-        self.height_mm = 50
-        self.gap_mm = 2
-        
-        # Barcode settings
-        self.barcode_type = 'code128'
-        self.barcode_height = 15  # mm
-        self.barcode_width = 2  # bar width multiplier
-        
-        # Text settings
-        self.font_size = 24
-        self.top_text = ''
-        self.bottom_text = ''
-        self.barcode_data = ''
-        
-        # Print settings
-        self.orientation = 1  # 1 = human-friendly, 0 = paper-friendly
-        self.num_copies = 1
+    # Label dimensions
+    width_mm: int = 100
+    height_mm: int = 50
+    gap_mm: int = 2
+    
+    # Barcode settings
+    barcode_type: str = 'code128'
+    barcode_height: int = 15  # mm
+    barcode_width: int = 2  # bar width multiplier
+    
+    # Text settings
+    font_size: int = 24
+    top_text: str = ''
+    bottom_text: str = ''
+    barcode_data: str = ''
+    
+    # Print settings
+    orientation: int = 1  # 1 = human-friendly, 0 = paper-friendly
+    num_copies: int = 1
+
+    def _key(self):
+        """Fields that affect the rendered label (print-only settings excluded)"""
+        return (self.width_mm, self.height_mm, self.barcode_type, self.barcode_data,
+                self.barcode_height, self.barcode_width, self.font_size,
+                self.top_text, self.bottom_text)
 
 
 class ThermalPrinter:
     """Handles communication with thermal printer using TSPL"""
     
-    def __init__(self, printer_path, dry_run=False):
+    def __init__(self, printer_path, dry_run=False, sink=None):
         self.printer_path = printer_path
         self.dry_run = dry_run
+        self.sink = sink  # stream for dry-run output, stdout if None
         self.printer = None
-        self.is_windows = platform.system() == 'Windows'
+        self.is_windows = IS_WINDOWS
         self.is_com_port = False
+        self._buf = bytearray()  # TSPL program, sent to the printer by flush()
+        self._eol = b'\n' if dry_run else b'\r\n'
         
         if not self.dry_run:
             try:
                 if self.is_windows:
                     # Check if it's a COM port (e.g., COM1, COM2, COM3)
-                    if printer_path.upper().startswith('COM'):
+                    if _COM_RE.fullmatch(printer_path):
                         # For COM ports, we'd need pyserial, but for now use win32print
                         # Most thermal printers on Windows should be accessed by name
                         self.is_com_port = True
@@ -71,8 +113,7 @@ class ThermalPrinter:
                     else:
                         # Use Windows printer name - will use win32print if available
                         try:
-                            import win32print
-                            self.win32print = win32print
+                            self.win32print = _win32print()
                             self.printer_handle = None
                         except ImportError:
                             raise Exception("For Windows printing, install pywin32: pip install pywin32")
@@ -100,41 +141,30 @@ class ThermalPrinter:
         if self.is_windows:
             # Windows: Assume printer is ready
             return True
-        return re.fullmatch(r'[@BCFPW]@@@', self.printer_status()) is not None
+        return _STATUS_RE.fullmatch(self.printer_status()) is not None
     
-    def wait_printer(self):
-        """Wait for printer to be ready"""
+    def wait_printer(self, max_wait_s=30.0):
+        """Wait for printer to be ready, polling with exponential backoff"""
         if self.dry_run:
             return
         
         if not self.can_print():
             print('Waiting for printer...', file=sys.stderr)
-            time.sleep(0.5)
+            deadline = time.monotonic() + max_wait_s
+            delay = 0.05
             while not self.can_print():
-                time.sleep(1)
+                if time.monotonic() >= deadline:
+                    raise Exception(f"Printer not ready after {max_wait_s:g} s")
+                time.sleep(delay)
+                delay = min(delay * 1.6, 1.0)
     
     def command(self, cmd):
-        """Send command to printer"""
-        if self.dry_run:
-            print(cmd)
-        else:
-            if self.is_windows:
-                # Windows: Collect commands and send as raw data
-                if not hasattr(self, '_command_buffer'):
-                    self._command_buffer = []
-                self._command_buffer.append(cmd + '\r\n')
-            else:
-                # Linux/Unix: Send directly to device
-                os.write(self.printer, cmd.encode('utf-8'))
-                os.write(self.printer, b'\r\n')
+        """Queue command for the printer"""
+        self._buf += cmd.encode('utf-8')
+        self._buf += self._eol
     
     def setup_page(self, config):
         """Setup page dimensions and settings"""
-        # Initialize command buffer for Windows
-        if self.is_windows and not self.dry_run:
-            if not hasattr(self, '_command_buffer'):
-                self._command_buffer = []
-        
         self.command(f'SIZE {config.width_mm} mm,{config.height_mm} mm')
         self.command(f'GAP {config.gap_mm} mm,0 mm')
         self.command('CODEPAGE UTF-8')
@@ -145,38 +175,84 @@ class ThermalPrinter:
         """Print barcode label"""
         self.wait_printer()
         self.setup_page(config)
+        self._label_commands(config)
+        self.flush()
+    
+    def print_batch(self, configs):
+        """Print several labels as one job, repeating page setup only when it changes"""
+        self.wait_printer()
+        
+        page = None
+        # Runs of identical labels become one program printed with all their copies
+        for _, group in itertools.groupby(configs, lambda c: (c._key(), c.gap_mm, c.orientation)):
+            group = list(group)
+            config = group[0]
+            # SIZE/GAP/DIRECTION persist on the printer; CLS alone starts a new label
+            label_page = (config.width_mm, config.height_mm, config.gap_mm, config.orientation)
+            if label_page != page:
+                self.setup_page(config)
+                page = label_page
+            else:
+                self.command('CLS')
+            self._label_commands(config, sum(c.num_copies for c in group))
+        
+        self.flush()
+    
+    def _label_commands(self, config, copies=None):
+        """Queue the content and PRINT commands of one label"""
+        self._buf += ThermalPrinter._label_program(config._key(), self._eol)
         
-        width_dots = config.width_mm * DOTS_MM
-        height_dots = config.height_mm * DOTS_MM
-        x_center = width_dots // 2
+        # Print the label
+        self.command(f'PRINT 1,{config.num_copies if copies is None else copies}')
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _label_program(key, eol):
+        """Encoded TEXT/BARCODE commands for a BarcodeConfig._key() tuple"""
+        (width_mm, height_mm, barcode_type, barcode_data, barcode_height,
+         barcode_width, font_size, top_text, bottom_text) = key
         
+        x_center = width_mm * DOTS_MM // 2
         y_pos = 10  # Start position
+        commands = []
         
         # Print top text if present
-        if config.top_text:
-            self.command(f'TEXT {x_center},{y_pos},"0",0,{config.font_size},{config.font_size},2,"{config.top_text}"')
-            y_pos += config.font_size + 10
+        if top_text:
+            commands.append(f'TEXT {x_center},{y_pos},"0",0,{font_size},{font_size},2,"{top_text}"')
+            y_pos += font_size + 10
         
         # Print barcode
-        if config.barcode_data:
-            barcode_height_dots = config.barcode_height * DOTS_MM
-            self.command(f'BARCODE {x_center},{y_pos},"128",{barcode_height_dots},1,0,{config.barcode_width},2,"{config.barcode_data}"')
+        if barcode_data:
+            barcode_height_dots = barcode_height * DOTS_MM
+            commands.append(f'BARCODE {x_center},{y_pos},"128",{barcode_height_dots},1,0,{barcode_width},2,"{barcode_data}"')
             y_pos += barcode_height_dots + 20
         
         # Print bottom text if present
-        if config.bottom_text:
-            self.command(f'TEXT {x_center},{y_pos},"0",0,{config.font_size},{config.font_size},2,"{config.bottom_text}"')
+        if bottom_text:
+            commands.append(f'TEXT {x_center},{y_pos},"0",0,{font_size},{font_size},2,"{bottom_text}"')
         
-        # Print the label
-        self.command(f'PRINT 1,{config.num_copies}')
-        
-        # On Windows, flush all commands to printer
-        if self.is_windows and not self.dry_run and hasattr(self, '_command_buffer'):
-            self._flush_commands()
+        return b''.join(cmd.encode('utf-8') + eol for cmd in commands)
     
-    def _flush_commands(self):
-        """Send buffered commands to Windows printer"""
-        if not hasattr(self, '_command_buffer') or not self._command_buffer:
+    def flush(self):
+        """Send queued commands to the printer in a single write"""
+        if not self._buf:
+            return
+        
+        if self.dry_run:
+            # Dry run: show the commands on the console instead
+            (self.sink or sys.stdout).write(self._buf.decode('utf-8'))
+            self._buf.clear()
+            return
+        
+        if not self.is_windows:
+            # os.write() may accept only part of a large job; send the rest
+            data = memoryview(self._buf)
+            try:
+                while data:
+                    data = data[os.write(self.printer, data):]
+            finally:
+                data.release()
+            self._buf.clear()
             return
         
         try:
@@ -189,8 +265,7 @@ class ThermalPrinter:
                     self.win32print.StartPagePrinter(printer_handle)
                     
                     # Send all buffered commands
-                    all_commands = ''.join(self._command_buffer).encode('utf-8')
-                    self.win32print.WritePrinter(printer_handle, all_commands)
+                    self.win32print.WritePrinter(printer_handle, bytes(self._buf))
                     
                     self.win32print.EndPagePrinter(printer_handle)
                 finally:
@@ -199,17 +274,14 @@ class ThermalPrinter:
                 self.win32print.ClosePrinter(printer_handle)
             
             # Clear buffer
-            self._command_buffer = []
+            self._buf.clear()
         except Exception as e:
             raise Exception(f"Failed to send data to Windows printer: {e}")
     
     def close(self):
         """Close printer connection"""
-        if self.is_windows:
-            # Windows: Commands are already sent via win32print
-            if hasattr(self, '_command_buffer'):
-                self._command_buffer = []
-        elif self.printer is not None:
+        self._buf.clear()
+        if self.printer is not None:
             os.close(self.printer)
 
 
@@ -218,82 +290,93 @@ class BarcodePreview:
     
     @staticmethod
     def generate(config, dpi=203):
-        """Generate PIL Image preview of the label"""
+        """Generate PIL Image preview of the label
+
+        Images are cached by config, so callers must copy() before mutating.
+        """
+        return BarcodePreview._render(config._key(), dpi)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _blank(width_px, height_px):
+        """White label with border, shared between renders (never draw on it)"""
+        # 8-bit grayscale, the label is black on white
+        img = Image.new('L', (width_px, height_px), 255)
+        ImageDraw.Draw(img).rectangle([(0, 0), (width_px-1, height_px-1)], outline=0, width=2)
+        return img
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _render(key, dpi):
+        """Render the label for a BarcodeConfig._key() tuple"""
+        (width_mm, height_mm, barcode_type, barcode_data, barcode_height,
+         barcode_width, font_size, top_text, bottom_text) = key
+
         # Convert mm to pixels at given DPI
         px_per_mm = dpi / 25.4
-        width_px = int(config.width_mm * px_per_mm)
-        height_px = int(config.height_mm * px_per_mm)
+        width_px = int(width_mm * px_per_mm)
+        height_px = int(height_mm * px_per_mm)
         
-        # Create white background
-        from PIL import Image, ImageDraw, ImageFont
-        img = Image.new('RGB', (width_px, height_px), 'white')
+        # Start from a copy of the blank bordered label; the render is cached
+        # and handed to other threads, so it must not share pixels
+        img = BarcodePreview._blank(width_px, height_px).copy()
         draw = ImageDraw.Draw(img)
         
-        # Draw border
-        draw.rectangle([(0, 0), (width_px-1, height_px-1)], outline='black', width=2)
-        
         y_pos = 20
         
         # Try to use a nice font, fall back to default
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", config.font_size)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", config.font_size)
-            except:
-                font = ImageFont.load_default()
+        font = (_load_font("/System/Library/Fonts/Helvetica.ttc", font_size)
+                or _load_font("arial.ttf", font_size)
+                or _default_font())
         
         # Draw top text
-        if config.top_text:
-            bbox = draw.textbbox((0, 0), config.top_text, font=font)
+        if top_text:
+            bbox = draw.textbbox((0, 0), top_text, font=font)
             text_width = bbox[2] - bbox[0]
             x_pos = (width_px - text_width) // 2
-            draw.text((x_pos, y_pos), config.top_text, fill='black', font=font)
-            y_pos += config.font_size + 20
+            draw.text((x_pos, y_pos), top_text, fill=0, font=font)
+            y_pos += font_size + 20
         
         # Generate and draw barcode
-        if config.barcode_data:
+        if barcode_data:
             try:
-                # Generate barcode
-                barcode_class = barcode.get_barcode_class(config.barcode_type)
-                barcode_instance = barcode_class(config.barcode_data, writer=ImageWriter())
+                # Encode to the module pattern, e.g. '1101001...'
+                barcode_class = barcode.get_barcode_class(barcode_type)
+                modules = ''.join(barcode_class(barcode_data, writer=None).build())
                 
-                # Generate barcode image in memory
-                buffer = io.BytesIO()
-                options = {
-                    'module_height': config.barcode_height,
-                    'module_width': config.barcode_width * 0.5,
-                    'quiet_zone': 2,
-                    'font_size': 0,  # Don't show text in barcode
-                    'text_distance': 2,
-                }
-                barcode_instance.write(buffer, options=options)
-                buffer.seek(0)
-                
-                # Load and resize barcode image
-                barcode_img = Image.open(buffer)
-                barcode_width = int(width_px * 0.8)
-                aspect_ratio = barcode_img.height / barcode_img.width
-                barcode_height = int(barcode_width * aspect_ratio)
-                barcode_img = barcode_img.resize((barcode_width, barcode_height), Image.Resampling.LANCZOS)
+                # Turn the pattern into a one-pixel-high scanline and let PIL
+                # stretch it to the target size; NEAREST keeps bars crisp
+                # Module width as printed: barcode_width dots at 203 dpi
+                module_px = max(1, round(barcode_width * dpi / 203))
+                strip_width = module_px * len(modules)
+                resample = Image.Resampling.NEAREST
+                fit_px = int(width_px * 0.8)
+                if strip_width > fit_px:
+                    # Too wide for the label: squeeze the bars inside the border
+                    strip_width = min(fit_px, width_px - 4)
+                    resample = Image.Resampling.BOX
+                strip_height = int(barcode_height * px_per_mm)
+                scanline = modules.encode('ascii').translate(_BAR_PIXELS)
+                strip = Image.frombytes('L', (len(modules), 1), scanline)
+                strip = strip.resize((strip_width, strip_height), resample)
                 
                 # Paste barcode centered
-                x_barcode = (width_px - barcode_width) // 2
-                img.paste(barcode_img, (x_barcode, y_pos))
-                y_pos += barcode_height + 10
+                x_barcode = (width_px - strip_width) // 2
+                img.paste(strip, (x_barcode, y_pos))
+                y_pos += strip_height + 10
                 
             except Exception as e:
-                # If barcode generation fails, show error text
+                # If barcode generation fails, show error text in gray
                 error_text = f"Barcode Error: {str(e)}"
-                draw.text((10, y_pos), error_text, fill='red', font=font)
-                y_pos += config.font_size + 10
+                draw.text((10, y_pos), error_text, fill=128, font=font)
+                y_pos += font_size + 10
         
         # Draw bottom text
-        if config.bottom_text:
-            bbox = draw.textbbox((0, 0), config.bottom_text, font=font)
+        if bottom_text:
+            bbox = draw.textbbox((0, 0), bottom_text, font=font)
             text_width = bbox[2] - bbox[0]
             x_pos = (width_px - text_width) // 2
-            draw.text((x_pos, y_pos), config.bottom_text, fill='black', font=font)
+            draw.text((x_pos, y_pos), bottom_text, fill=0, font=font)
         
         return img
 
@@ -308,6 +391,16 @@ class BarcodePrinterGUI:
         
         self.config = BarcodeConfig()
         self.preview_image = None
+        self._photo_size = None  # (width, height) of preview_image
+        self._last_render_ms = 200  # wall time of the last preview render
+        self._printer_cache = (float('-inf'), set())  # (refresh time, local printer names)
+        
+        # Previews render on a worker thread; the queue holds only the newest job
+        self._job_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._render_worker, daemon=True).start()
+        
+        # Print jobs run one at a time off the Tk main thread
+        self._print_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='print')
         
         self.setup_ui()
         self.update_preview()
@@ -438,8 +531,8 @@ class BarcodePrinterGUI:
         row += 1
         
         # Printer Path
-        printer_label_text = "Printer Device:" if platform.system() != 'Windows' else "Printer Name:"
-        help_text = " (e.g., /dev/usb/lp0)" if platform.system() != 'Windows' else " (e.g., Thermal Printer)"
+        printer_label_text = "Printer Device:" if not IS_WINDOWS else "Printer Name:"
+        help_text = " (e.g., /dev/usb/lp0)" if not IS_WINDOWS else " (e.g., Thermal Printer)"
         ttk.Label(controls_frame, text=printer_label_text + help_text).grid(row=row, column=0, sticky=tk.W, pady=5)
         self.printer_path_var = tk.StringVar(value=PRINTER)
         ttk.Entry(controls_frame, textvariable=self.printer_path_var, width=25).grid(
@@ -454,6 +547,8 @@ class BarcodePrinterGUI:
                   command=self.update_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Print", 
                   command=self.print_label, style='Accent.TButton').pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Print Batch", 
+                  command=self.print_batch).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Save Image", 
                   command=self.save_preview).pack(side=tk.LEFT, padx=5)
         
@@ -465,20 +560,32 @@ class BarcodePrinterGUI:
         self.preview_canvas = tk.Canvas(preview_frame, bg='white', 
                                        width=400, height=500, relief=tk.SUNKEN, bd=2)
         self.preview_canvas.pack(expand=True, fill=tk.BOTH)
-        
-        # Bind variables to auto-update preview
-        for var in [self.barcode_data_var, self.barcode_type_var, self.top_text_var, 
-                   self.bottom_text_var, self.width_var, self.height_var, 
-                   self.barcode_height_var, self.barcode_width_var, self.font_size_var]:
-            var.trace_add('write', lambda *args: self.schedule_preview_update())
+        self._canvas_img_id = self.preview_canvas.create_image(0, 0, anchor=tk.NW)
+        
+        # Bind the inputs of these variables to auto-update preview
+        preview_vars = {str(var) for var in [
+            self.barcode_data_var, self.barcode_type_var, self.top_text_var, 
+            self.bottom_text_var, self.width_var, self.height_var, 
+            self.barcode_height_var, self.barcode_width_var, self.font_size_var]}
+        for widget in controls_frame.winfo_children():
+            # ttk.Combobox and ttk.Spinbox are ttk.Entry subclasses
+            if not isinstance(widget, ttk.Entry) or str(widget.cget('textvariable')) not in preview_vars:
+                continue
+            if isinstance(widget, ttk.Combobox):
+                widget.bind('<<ComboboxSelected>>', lambda e: self.schedule_preview_update())
+            else:
+                widget.bind('<KeyRelease>', lambda e: self.schedule_preview_update())
+            if isinstance(widget, ttk.Spinbox):
+                widget.configure(command=self.schedule_preview_update)
         
         self.preview_update_id = None
     
     def schedule_preview_update(self):
-        """Schedule preview update with debounce"""
+        """Schedule preview update, debounced by twice the last render time"""
         if self.preview_update_id:
             self.root.after_cancel(self.preview_update_id)
-        self.preview_update_id = self.root.after(500, self.update_preview)
+        delay = int(min(max(2 * self._last_render_ms, 80), 800))
+        self.preview_update_id = self.root.after(delay, self.update_preview)
     
     def get_config_from_ui(self):
         """Get configuration from UI inputs"""
@@ -497,13 +604,53 @@ class BarcodePrinterGUI:
         return config
     
     def update_preview(self):
-        """Update the preview image"""
+        """Queue a preview render of the current settings"""
         try:
             config = self.get_config_from_ui()
-            
-            # Generate preview image
-            preview_img = BarcodePreview.generate(config)
-            
+        except Exception as e:
+            self._show_preview_error(e)
+            return
+        
+        # Replace any pending job that the worker has not picked up yet
+        try:
+            self._job_q.put_nowait(config)
+        except queue.Full:
+            try:
+                self._job_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._job_q.put_nowait(config)
+    
+    def _render_worker(self):
+        """Render queued configs off the Tk main thread"""
+        while True:
+            config = self._job_q.get()
+            t0 = time.perf_counter()
+            try:
+                preview_img = BarcodePreview.generate(config)
+            except Exception as e:
+                self._hand_off(config, self._show_preview_error, e)
+                continue
+            self._last_render_ms = (time.perf_counter() - t0) * 1000
+            self._hand_off(config, self._apply_preview, preview_img)
+    
+    def _hand_off(self, config, func, arg):
+        """Pass a render result to the Tk main thread without killing the worker"""
+        try:
+            self.root.after(0, func, arg)
+        except (RuntimeError, tk.TclError):
+            # Tk is not taking calls: the main loop has not started yet, or the
+            # window is being destroyed. Retry the job shortly unless a newer
+            # one is already queued; the render itself is cached.
+            time.sleep(0.1)
+            try:
+                self._job_q.put_nowait(config)
+            except queue.Full:
+                pass
+    
+    def _apply_preview(self, preview_img):
+        """Fit a rendered preview to the canvas and display it"""
+        try:
             # Resize to fit canvas
             canvas_width = self.preview_canvas.winfo_width()
             canvas_height = self.preview_canvas.winfo_height()
@@ -525,19 +672,32 @@ class BarcodePrinterGUI:
                 new_height = int(canvas_height * 0.9)
                 new_width = int(new_height * img_ratio)
             
-            preview_img = preview_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # BILINEAR is indistinguishable from LANCZOS at canvas scale;
+            # skip resizing altogether when the image already nearly fits
+            if abs(new_width - preview_img.width) >= 4:
+                preview_img = preview_img.resize((new_width, new_height), Image.Resampling.BILINEAR)
+            new_width, new_height = preview_img.size
             
-            # Convert to PhotoImage
-            self.preview_image = ImageTk.PhotoImage(preview_img)
+            # Convert to PhotoImage, pasting into the existing one if the size is unchanged
+            preview_img = preview_img.convert('RGB')
+            if (new_width, new_height) == self._photo_size and self.preview_image is not None:
+                self.preview_image.paste(preview_img)
+            else:
+                self.preview_image = ImageTk.PhotoImage(preview_img)
+                self._photo_size = (new_width, new_height)
+                self.preview_canvas.itemconfig(self._canvas_img_id, image=self.preview_image)
             
-            # Display on canvas
-            self.preview_canvas.delete("all")
+            # Center the canvas image item on the canvas
             x = (canvas_width - new_width) // 2
             y = (canvas_height - new_height) // 2
-            self.preview_canvas.create_image(x, y, anchor=tk.NW, image=self.preview_image)
+            self.preview_canvas.coords(self._canvas_img_id, x, y)
             
         except Exception as e:
-            messagebox.showerror("Preview Error", f"Failed to generate preview:\n{str(e)}")
+            self._show_preview_error(e)
+    
+    def _show_preview_error(self, error):
+        """Report a failed preview render"""
+        messagebox.showerror("Preview Error", f"Failed to generate preview:\n{str(error)}")
     
     def save_preview(self):
         """Save preview image to file"""
@@ -572,43 +732,108 @@ class BarcodePrinterGUI:
             if not result:
                 return
             
-            # Check if running in dry-run mode
-            if platform.system() == 'Windows':
-                # Windows: Check if printer exists by trying to open it
-                try:
-                    import win32print
-                    printers = [p[2] for p in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL)]
-                    dry_run = printer_path not in printers
-                except ImportError:
-                    # If win32print not available, assume dry run
-                    dry_run = True
-                except:
-                    # If check fails, assume dry run
-                    dry_run = True
-            else:
-                # Linux/Unix: Check if device file exists
-                dry_run = not os.path.exists(printer_path)
+            self._submit_print(printer_path, [config])
+        
+        except Exception as e:
+            messagebox.showerror("Print Error", f"Failed to print:\n{str(e)}")
+    
+    def print_batch(self):
+        """Print one label per barcode value in a CSV file (first column)"""
+        try:
+            filename = filedialog.askopenfilename(
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            )
             
-            if dry_run:
-                messagebox.showwarning(
-                    "Dry Run Mode",
-                    f"Printer device not found at:\n{printer_path}\n\n"
-                    "Running in DRY-RUN mode.\nCommands will be printed to console."
-                )
+            if not filename:
+                return
             
-            # Print
-            printer = ThermalPrinter(printer_path, dry_run=dry_run)
-            printer.print_barcode(config)
-            printer.close()
+            with open(filename, newline='', encoding='utf-8-sig') as f:
+                values = [row[0].strip() for row in csv.reader(f) if row and row[0].strip()]
             
-            if not dry_run:
-                messagebox.showinfo("Success", "Label sent to printer!")
-            else:
-                messagebox.showinfo("Dry Run Complete", 
-                                   "Check console for TSPL commands.")
+            if not values:
+                messagebox.showwarning("Print Batch", f"No barcode values found in:\n{filename}")
+                return
+            
+            # Every label uses the current settings with its own barcode data
+            base_config = self.get_config_from_ui()
+            configs = [dataclasses.replace(base_config, barcode_data=value) for value in values]
+            printer_path = self.printer_path_var.get()
+            
+            # Ask for confirmation
+            result = messagebox.askyesno(
+                "Confirm Print",
+                f"Print {len(configs)} different label(s), {base_config.num_copies} "
+                f"copies each, to:\n{printer_path}?"
+            )
+            
+            if not result:
+                return
+            
+            self._submit_print(printer_path, configs)
         
         except Exception as e:
             messagebox.showerror("Print Error", f"Failed to print:\n{str(e)}")
+    
+    def _submit_print(self, printer_path, configs):
+        """Queue labels for the print thread, falling back to a dry run"""
+        # Check if running in dry-run mode
+        if IS_WINDOWS:
+            # Windows: Check if printer exists by trying to open it
+            try:
+                dry_run = printer_path not in self._local_printers()
+            except ImportError:
+                # If win32print not available, assume dry run
+                dry_run = True
+            except:
+                # If check fails, assume dry run
+                dry_run = True
+        else:
+            # Linux/Unix: Check if device file exists
+            dry_run = not os.path.exists(printer_path)
+        
+        if dry_run:
+            messagebox.showwarning(
+                "Dry Run Mode",
+                f"Printer device not found at:\n{printer_path}\n\n"
+                "Running in DRY-RUN mode.\nCommands will be printed to console."
+            )
+        
+        # Print; waiting for the printer must not freeze the UI
+        future = self._print_pool.submit(self._send_to_printer, printer_path, dry_run, configs)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._show_print_result, f, dry_run))
+    
+    @staticmethod
+    def _send_to_printer(printer_path, dry_run, configs):
+        """Print labels as one job, called on the print thread"""
+        printer = ThermalPrinter(printer_path, dry_run=dry_run)
+        try:
+            printer.print_batch(configs)
+        finally:
+            printer.close()
+    
+    def _show_print_result(self, future, dry_run):
+        """Report the outcome of a finished print job"""
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Print Error", f"Failed to print:\n{str(e)}")
+            return
+        
+        if not dry_run:
+            messagebox.showinfo("Success", "Label sent to printer!")
+        else:
+            messagebox.showinfo("Dry Run Complete", 
+                               "Check console for TSPL commands.")
+    
+    def _local_printers(self):
+        """Names of local Windows printers, re-enumerated at most every 5 s"""
+        timestamp, printers = self._printer_cache
+        if time.monotonic() - timestamp > 5.0:
+            wp = _win32print()
+            printers = {p[2] for p in wp.EnumPrinters(wp.PRINTER_ENUM_LOCAL)}
+            self._printer_cache = (time.monotonic(), printers)
+        return printers
 
 
 def main():
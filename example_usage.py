@@ -3,12 +3,52 @@
 Example usage of the barcode printer programmatically
 """
 
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from barcode_printer_gui import BarcodeConfig, ThermalPrinter, BarcodePreview
 
+PREVIEW_FORMAT = "JPEG"  # "JPEG", "WEBP" or "PNG"; PNG is by far the slowest to encode
+
+# File extension and PIL save options per preview format
+_PREVIEW_FORMATS = {
+    "JPEG": (".jpg", {"quality": 85, "optimize": False}),
+    "WEBP": (".webp", {"quality": 80, "method": 0}),
+    "PNG": (".png", {"compress_level": 1, "optimize": False}),  # fast DEFLATE, slightly larger
+}
+
+# Encoded preview files by (BarcodeConfig._key(), format), so a label is encoded only once
+_preview_bytes = {}
+
+
+def _save_preview(config, name):
+    """Save the label preview as name plus the PREVIEW_FORMAT extension, return the file name"""
+    extension, options = _PREVIEW_FORMATS[PREVIEW_FORMAT]
+    key = (config._key(), PREVIEW_FORMAT)
+    data = _preview_bytes.get(key)
+    if data is None:
+        preview = BarcodePreview.generate(config)
+        if PREVIEW_FORMAT == "PNG":
+            # Labels are black on white; a 1-bit PNG is smaller and quicker to encode.
+            # Only near-white becomes white, so gray error text and glyph edges stay black.
+            preview = preview.point(lambda p: 255 if p > 200 else 0, "1")
+        buffer = io.BytesIO()
+        preview.save(buffer, PREVIEW_FORMAT, **options)
+        data = _preview_bytes[key] = buffer.getvalue()
+    filename = name + extension
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return filename
+
+
 def example_1_basic_barcode():
     """Example 1: Basic barcode label"""
-    print("Example 1: Basic Barcode Label")
-    print("-" * 50)
+    out = io.StringIO()  # returned to main(), which prints the examples in order
+    w = out.write
+    w("Example 1: Basic Barcode Label\n")
+    w("-" * 50 + "\n")
     
     config = BarcodeConfig()
     config.barcode_data = "123456789012"
@@ -18,22 +58,24 @@ def example_1_basic_barcode():
     config.height_mm = 50
     
     # Generate preview and save
-    preview = BarcodePreview.generate(config)
-    preview.save("example1_basic_barcode.png")
-    print("✓ Preview saved as: example1_basic_barcode.png")
+    filename = _save_preview(config, "example1_basic_barcode")
+    w(f"✓ Preview saved as: {filename}\n")
     
     # Print to thermal printer (dry run)
-    printer = ThermalPrinter('/dev/usb/lp0', dry_run=True)
-    print("\nTSPL Commands:")
+    printer = ThermalPrinter('/dev/usb/lp0', dry_run=True, sink=out)
+    w("\nTSPL Commands:\n")
     printer.print_barcode(config)
     printer.close()
-    print()
+    w("\n")
+    return out.getvalue()
 
 
 def example_2_ean13_barcode():
     """Example 2: EAN13 barcode for retail"""
-    print("Example 2: EAN13 Barcode")
-    print("-" * 50)
+    out = io.StringIO()
+    w = out.write
+    w("Example 2: EAN13 Barcode\n")
+    w("-" * 50 + "\n")
     
     config = BarcodeConfig()
     config.barcode_type = 'ean13'
@@ -44,16 +86,18 @@ def example_2_ean13_barcode():
     config.height_mm = 40
     config.barcode_height = 12
     
-    preview = BarcodePreview.generate(config)
-    preview.save("example2_ean13.png")
-    print("✓ Preview saved as: example2_ean13.png")
-    print()
+    filename = _save_preview(config, "example2_ean13")
+    w(f"✓ Preview saved as: {filename}\n")
+    w("\n")
+    return out.getvalue()
 
 
 def example_3_asset_tag():
     """Example 3: Asset tracking label"""
-    print("Example 3: Asset Tracking Label")
-    print("-" * 50)
+    out = io.StringIO()
+    w = out.write
+    w("Example 3: Asset Tracking Label\n")
+    w("-" * 50 + "\n")
     
     config = BarcodeConfig()
     config.barcode_type = 'code128'
@@ -65,16 +109,18 @@ def example_3_asset_tag():
     config.barcode_height = 10
     config.font_size = 18
     
-    preview = BarcodePreview.generate(config)
-    preview.save("example3_asset_tag.png")
-    print("✓ Preview saved as: example3_asset_tag.png")
-    print()
+    filename = _save_preview(config, "example3_asset_tag")
+    w(f"✓ Preview saved as: {filename}\n")
+    w("\n")
+    return out.getvalue()
 
 
 def example_4_batch_printing():
     """Example 4: Batch print multiple labels"""
-    print("Example 4: Batch Printing")
-    print("-" * 50)
+    out = io.StringIO()
+    w = out.write
+    w("Example 4: Batch Printing\n")
+    w("-" * 50 + "\n")
     
     # Generate multiple different labels
     labels = [
@@ -83,26 +129,39 @@ def example_4_batch_printing():
         {"data": "ITEM-003", "top": "Widget C", "bottom": "Aisle 3"},
     ]
     
-    printer = ThermalPrinter('/dev/usb/lp0', dry_run=True)
+    printer = ThermalPrinter('/dev/usb/lp0', dry_run=True, sink=out)
     
+    # Only the text fields change between labels
+    config = BarcodeConfig()
     for i, label_data in enumerate(labels, 1):
-        config = BarcodeConfig()
         config.barcode_data = label_data["data"]
         config.top_text = label_data["top"]
         config.bottom_text = label_data["bottom"]
         
-        print(f"\nLabel {i}:")
+        w(f"\nLabel {i}:\n")
         printer.print_barcode(config)
     
+    # The same labels as one job, with two of Widget B: print_batch() sets up
+    # the page once and prints runs of identical labels with PRINT 1,<copies>
+    w("\nOne job, two copies of Label 2:\n")
+    configs = [BarcodeConfig(barcode_data=label_data["data"],
+                             top_text=label_data["top"],
+                             bottom_text=label_data["bottom"])
+               for label_data in (labels[0], labels[1], labels[1], labels[2])]
+    printer.print_batch(configs)
+    
     printer.close()
-    print("\n✓ Batch print complete")
-    print()
+    w("\n✓ Batch print complete\n")
+    w("\n")
+    return out.getvalue()
 
 
 def example_5_custom_sizes():
     """Example 5: Different label sizes"""
-    print("Example 5: Custom Label Sizes")
-    print("-" * 50)
+    out = io.StringIO()
+    w = out.write
+    w("Example 5: Custom Label Sizes\n")
+    w("-" * 50 + "\n")
     
     sizes = [
         {"name": "Small", "width": 50, "height": 30, "barcode_h": 8, "font": 16},
@@ -110,7 +169,7 @@ def example_5_custom_sizes():
         {"name": "Large", "width": 100, "height": 60, "barcode_h": 20, "font": 28},
     ]
     
-    for size in sizes:
+    def save_size(size):
         config = BarcodeConfig()
         config.barcode_data = "SIZE-TEST"
         config.top_text = f"{size['name']} Label"
@@ -120,11 +179,16 @@ def example_5_custom_sizes():
         config.barcode_height = size['barcode_h']
         config.font_size = size['font']
         
-        preview = BarcodePreview.generate(config)
-        preview.save(f"example5_{size['name'].lower()}_size.png")
-        print(f"✓ {size['name']} label saved: {size['width']}mm × {size['height']}mm")
+        _save_preview(config, f"example5_{size['name'].lower()}_size")
+        return f"✓ {size['name']} label saved: {size['width']}mm × {size['height']}mm"
     
-    print()
+    # Render the sizes concurrently; map() keeps the output in order
+    with ThreadPoolExecutor(max_workers=len(sizes)) as pool:
+        for line in pool.map(save_size, sizes):
+            w(line + "\n")
+    
+    w("\n")
+    return out.getvalue()
 
 
 def main():
@@ -134,16 +198,21 @@ def main():
     print("=" * 50)
     print()
     
+    examples = (example_1_basic_barcode, example_2_ean13_barcode, example_3_asset_tag,
+                example_4_batch_printing, example_5_custom_sizes)
+    
     try:
-        example_1_basic_barcode()
-        example_2_ean13_barcode()
-        example_3_asset_tag()
-        example_4_batch_printing()
-        example_5_custom_sizes()
+        # The examples are independent; PIL releases the GIL while rendering
+        # and encoding, so run them side by side
+        with ThreadPoolExecutor(max_workers=min(len(examples), os.cpu_count() or 4),
+                                thread_name_prefix="ex") as pool:
+            # map() yields the output in submission order, whatever finishes first
+            for text in pool.map(lambda example: example(), examples):
+                sys.stdout.write(text)
         
         print("=" * 50)
         print("All examples completed successfully!")
-        print("Check the generated PNG files for previews.")
+        print("Check the generated image files for previews.")
         print("=" * 50)
         
     except Exception as e:
@@ -23,10 +23,31 @@ import os
 import sys
 import time
 import argparse
+import functools
 import re
 
+_NL_RE = re.compile(r'[\n\r]+')  # line breaks, not allowed inside a badge line
+_STATUS_RE = re.compile(r'[@BCFPW]@@@')  # printer status meaning "ready"
+_CRLF = b'\r\n'  # TSPL line terminator
 
-def main(args):
+# Page setup commands that only depend on the constants above
+_PAGE_SETUP = (
+    f'SIZE {WIDTH_MM} mm,{HEIGHT_MM} mm'.encode('utf-8'),
+    f'GAP {GAP_MM} mm,0 mm'.encode('utf-8'),
+    b'CODEPAGE UTF-8',
+)
+
+
+def _strip_nl(s):
+    """Remove line breaks, skipping the regex for the usual single-line text"""
+    if '\n' in s or '\r' in s:
+        return _NL_RE.sub('', s)
+    return s
+
+
+@functools.cache
+def _build_parser():
+    """Build the command line parser once per process."""
     ap = argparse.ArgumentParser()
     ap.add_argument('-d', '--dry-run', action='store_true', default=False, help='do not print actually')
     ap.add_argument('-y', '--yes', action='store_true', default=False, help='print without confirmation')
@@ -35,18 +56,24 @@ def main(args):
                     help='orientation: 1 - human-friendly, 0 - paper-friendly')
     ap.add_argument('line1', nargs='?', default='')
     ap.add_argument('line2', nargs='?', default='')
+    return ap
 
-    params = ap.parse_args(args)
 
-    params.line1 = re.sub(r'[\n\r]+', '', params.line1)
-    params.line2 = re.sub(r'[\n\r]+', '', params.line2)
+def main(args):
+    params = _build_parser().parse_args(args)
+
+    params.line1 = _strip_nl(params.line1)
+    params.line2 = _strip_nl(params.line2)
 
     try:
         confirm = Confirm(params)
         if params.yes or confirm.confirm():
             badge = Badge(params)
             printer = Printer(params, badge)
-            printer.print()
+            try:
+                printer.print()
+            finally:
+                printer.close()
     except Exception as e:
         print(e, file=sys.stderr)
 
@@ -57,16 +84,14 @@ class Confirm:
         self.params = params
 
     @staticmethod
-    def print_line_centered(line):
+    def line_centered(line):
         spaces = (PREVIEW_WIDTH - len(line)) // 2
-        print(' ' * spaces, line, sep='')
+        return ' ' * spaces + line + '\n'
 
     def confirm(self):
-        print('-' * PREVIEW_WIDTH)
-        for i in range(0, self.params.num):
-            self.print_line_centered(self.params.line1)
-            self.print_line_centered(self.params.line2)
-        print('-' * PREVIEW_WIDTH)
+        bar = '-' * PREVIEW_WIDTH + '\n'
+        badge = self.line_centered(self.params.line1) + self.line_centered(self.params.line2)
+        sys.stdout.write(bar + badge * self.params.num + bar)
 
         reply = input('Print? [Y/n] ')
         print()
@@ -85,60 +110,44 @@ class Badge:
     line_height = (FONT_HEIGHT // 3 + LINES_GAP_MM) * DOTS_MM  # line height in pixels
     y_second_line = y_first_line + line_height  # Y position of the second line (top of the line)
 
+    # Encoded TEXT commands up to the text; everything but the text is constant
+    text_prefix1 = f'TEXT {x_center},{y_first_line},"{FONT}",0,{FONT_X_MULT},{FONT_Y_MULT},2,"'.encode('utf-8')
+    text_prefix2 = f'TEXT {x_center},{y_second_line},"{FONT}",0,{FONT_X_MULT},{FONT_Y_MULT},2,"'.encode('utf-8')
+
     def __init__(self, params):
         self.line1 = params.line1
         self.line2 = params.line2
 
     def print(self):
         commands = [
-            'CLS',
-            'TEXT {x},{y},"{font}",0,{font_x_mult},{font_y_mult},2,"{text}"'.format(
-                x=self.x_center, y=self.y_first_line,
-                font=FONT, font_x_mult=FONT_X_MULT, font_y_mult=FONT_Y_MULT,
-                text=self.line1),
-            'TEXT {x},{y},"{font}",0,{font_x_mult},{font_y_mult},2,"{text}"'.format(
-                x=self.x_center, y=self.y_second_line,
-                font=FONT, font_x_mult=FONT_X_MULT, font_y_mult=FONT_Y_MULT,
-                text=self.line2)
+            b'CLS',
+            self.text_prefix1 + self.line1.encode('utf-8') + b'"',
+            self.text_prefix2 + self.line2.encode('utf-8') + b'"',
         ]
         return commands
 
 
-class Printer:
+def Printer(params, badge, sink=None):
+    """Make a printer for the badge: a dry-run one or the USB device"""
+    if params.dry_run:
+        return _DryRunPrinter(params, badge, sink)
+    return _UsbPrinter(params, badge)
+
+
+class _Printer:
     width = WIDTH_MM * DOTS_MM
     height = HEIGHT_MM * DOTS_MM
+    _eol = _CRLF
 
     def __init__(self, params, badge):
         self.params = params
         self.badge = badge
-        if not self.params.dry_run:
-            self.printer = os.open(PRINTER, os.O_RDWR)
-
-    def printer_status(self):
-        os.write(self.printer, b"\x1B!S\r\n")
-        status = os.read(self.printer, 8)
-        return status[1:5].decode('ascii')
-
-    def can_print(self):
-        return re.fullmatch(r'[@BCFPW]@@@', self.printer_status()) is not None
-
-    def wait_printer(self):
-        if self.params.dry_run:
-            return
-
-        if not self.can_print():
-            print('...waiting printer...', end='', file=sys.stderr)
-            time.sleep(0.5)
-            while not self.can_print():
-                print('.', end='', file=sys.stderr)
-                time.sleep(1)
-            print(file=sys.stderr)
+        self._iov = []  # encoded TSPL lines and terminators, written out by flush()
 
     def page_setup(self):
-        self.command('SIZE {} mm,{} mm'.format(WIDTH_MM, HEIGHT_MM))
-        self.command('GAP {} mm,0 mm'.format(GAP_MM))
-        self.command('CODEPAGE UTF-8')
-        self.command('DIRECTION {}'.format(self.params.orient))
+        for cmd in _PAGE_SETUP:
+            self.command(cmd)
+        self.command(b'DIRECTION %d' % self.params.orient)
 
     def print(self):
         self.wait_printer()
@@ -147,16 +156,93 @@ class Printer:
         for cmd in self.badge.print():
             self.command(cmd)
 
-        self.command('PRINT 1,{}'.format(self.params.num))
+        self.command(b'PRINT 1,%d' % self.params.num)
+        self.flush()
 
         print(self.badge.line1, self.badge.line2)
 
     def command(self, cmd):
-        if self.params.dry_run:
-            print(cmd)
-        else:
-            os.write(self.printer, cmd.encode('utf-8'))
-            os.write(self.printer, b'\r\n')
+        """Queue an encoded TSPL command"""
+        self._iov += (cmd, self._eol)
+
+
+class _DryRunPrinter(_Printer):
+    """Shows the TSPL program instead of printing it, never touches the device"""
+    _eol = b'\n'
+
+    def __init__(self, params, badge, sink=None):
+        super().__init__(params, badge)
+        self.sink = sink  # stream for the output, stdout if None
+
+    def wait_printer(self):
+        """Nothing to wait for without a device"""
+
+    def flush(self):
+        (self.sink or sys.stdout).write(b''.join(self._iov).decode('utf-8'))
+        self._iov.clear()
+
+    def close(self):
+        """No device to close"""
+
+
+class _UsbPrinter(_Printer):
+
+    def __init__(self, params, badge):
+        super().__init__(params, badge)
+        # The lp device is only read for status, so jobs go through a write-only fd.
+        # usblp allows a single open at a time: the read-write status fd is
+        # closed once the printer is ready, before the write fd is opened.
+        self.printer = None
+        self._status_fd = None
+
+    def printer_status(self):
+        if self._status_fd is None:
+            self._status_fd = os.open(PRINTER, os.O_RDWR)
+        os.write(self._status_fd, b"\x1B!S\r\n")
+        status = os.read(self._status_fd, 8)
+        return status[1:5].decode('ascii')
+
+    def can_print(self):
+        return _STATUS_RE.fullmatch(self.printer_status()) is not None
+
+    def wait_printer(self):
+        try:
+            if not self.can_print():
+                print('...waiting printer...', end='', file=sys.stderr)
+                # The printer is usually ready within tens of ms: poll fast, then back off
+                delay = 0.005
+                while not self.can_print():
+                    print('.', end='', file=sys.stderr, flush=True)
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.1)
+                print(file=sys.stderr)
+        finally:
+            self._close_status()
+
+    def flush(self):
+        if self.printer is None:
+            self.printer = os.open(PRINTER, os.O_WRONLY)
+        sent = 0
+        if hasattr(os, 'writev'):
+            # Scatter-gather: one syscall, no joined copy of the buffers
+            sent = os.writev(self.printer, self._iov)
+        if sent < sum(map(len, self._iov)):
+            # Short write (or no writev): send whatever is left
+            rest = memoryview(b''.join(self._iov))[sent:]
+            while rest:
+                rest = rest[os.write(self.printer, rest):]
+        self._iov.clear()
+
+    def _close_status(self):
+        if self._status_fd is not None:
+            os.close(self._status_fd)
+            self._status_fd = None
+
+    def close(self):
+        self._close_status()
+        if self.printer is not None:
+            os.close(self.printer)
+            self.printer = None
 
 
 if __name__ == '__main__':